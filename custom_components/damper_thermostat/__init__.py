@@ -1,9 +1,13 @@
 """The Damper Thermostat integration."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     DOMAIN,
@@ -19,26 +23,31 @@ from .const import (
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SWITCH, Platform.SENSOR, Platform.SELECT]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Damper Thermostat integration."""
+    # Default global settings until the global settings entry is set up,
+    # initialized once before any config entry is loaded
+    hass.data.setdefault(DOMAIN, {})[CONF_GLOBAL_SETTINGS] = MappingProxyType({
+        CONF_GLOBAL_ACTUATOR_SWITCHES: [],
+        CONF_GLOBAL_MAX_SWITCHES_OFF: DEFAULT_MAX_SWITCHES_OFF,
+        CONF_GLOBAL_MIN_TEMP: DEFAULT_MIN_TEMP,
+        CONF_GLOBAL_MAX_TEMP: DEFAULT_MAX_TEMP,
+    })
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Damper Thermostat from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    
     # Check if this is a global settings entry
     if entry.data.get("entry_type") == "global_settings":
-        # Store global settings
-        hass.data[DOMAIN][CONF_GLOBAL_SETTINGS] = entry.data
+        # Store global settings, options saved through the options flow take precedence
+        hass.data[DOMAIN][CONF_GLOBAL_SETTINGS] = MappingProxyType({**entry.data, **entry.options})
         return True
     
-    # Initialize global settings with defaults if not present
-    if CONF_GLOBAL_SETTINGS not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][CONF_GLOBAL_SETTINGS] = {
-            CONF_GLOBAL_ACTUATOR_SWITCHES: [],
-            CONF_GLOBAL_MAX_SWITCHES_OFF: DEFAULT_MAX_SWITCHES_OFF,
-            CONF_GLOBAL_MIN_TEMP: DEFAULT_MIN_TEMP,
-            CONF_GLOBAL_MAX_TEMP: DEFAULT_MAX_TEMP,
-        }
-    
+    # Config entry data is already a read-only mapping
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -47,8 +56,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # The global settings entry never forwards its setup to the platforms,
+    # unloading them would fail and block reloading it with new options
+    if entry.data.get("entry_type") == "global_settings":
+        return True
+
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
 
     return unload_ok
 
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections import ChainMap
+from collections.abc import Callable
 import logging
-from typing import Any
+import math
+from typing import Any, ClassVar
 from types import MappingProxyType
 
 from homeassistant.components.climate import ClimateEntity
@@ -18,7 +21,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     CONF_NAME,
-    EVENT_HOMEASSISTANT_START,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STATE_UNAVAILABLE,
@@ -26,10 +28,12 @@ from homeassistant.const import (
     UnitOfTemperature,
     PRECISION_HALVES
 )
-from homeassistant.core import HomeAssistant, callback, Event, EventStateChangedData
+from homeassistant.core import HassJobType, HomeAssistant, callback, Event, EventStateChangedData
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
@@ -68,6 +72,62 @@ from . import get_global_setting
 
 _LOGGER = logging.getLogger(__name__)
 
+# Main thermostat actions that count as actively heating
+_HEATING_ACTIONS = frozenset({HVACAction.HEATING, HVACAction.PREHEATING})
+
+# Modes that use a single target temperature
+_SINGLE_TEMP_MODES = frozenset({HVACMode.COOL, HVACMode.HEAT})
+
+# Seconds to collect a burst of state changes into a single control run
+_CONTROL_DEBOUNCE_DELAY = 0.1
+
+# States that carry no usable reading
+_INVALID_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
+
+# Supported hvac modes by state value, used to validate and normalize hvac modes
+# so they can be compared by identity
+_HVAC_MODE_BY_VALUE = {mode.value: mode for mode in HVAC_MODES}
+
+# Any hvac mode and action by state value, used to read the main thermostat
+# as enum members
+_MAIN_HVAC_MODE_BY_VALUE = {mode.value: mode for mode in HVACMode}
+_HVAC_ACTION_BY_VALUE = {action.value: action for action in HVACAction}
+
+
+class _SensorAverage:
+    """Running average over the last valid reading of each sensor."""
+
+    def __init__(self) -> None:
+        """Initialize an empty average."""
+        self._values: dict[str, float] = {}
+        self._total = 0.0
+
+    def set(self, sensor_id: str, value: float) -> None:
+        """Set the reading of a sensor."""
+        self._total += value - self._values.get(sensor_id, 0.0)
+        self._values[sensor_id] = value
+
+    def discard(self, sensor_id: str) -> None:
+        """Drop the reading of a sensor."""
+        if (value := self._values.pop(sensor_id, None)) is not None:
+            # Restart from an exact zero so rounding errors don't accumulate
+            self._total = self._total - value if self._values else 0.0
+
+    @property
+    def average(self) -> float | None:
+        """Return the average reading, None without any reading."""
+        if not self._values:
+            return None
+        return self._total / len(self._values)
+
+
+def _as_tuple(entity_ids: str | list[str] | None) -> tuple[str, ...]:
+    """Return configured entity ids as a tuple, also for a single entity id."""
+    if isinstance(entity_ids, (list, tuple)):
+        return tuple(entity_ids)
+    return (entity_ids,) if entity_ids else ()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -83,109 +143,159 @@ async def async_setup_entry(
 class DamperThermostat(ClimateEntity, RestoreEntity):
     """Representation of a Damper Thermostat device."""
 
+    # Modes and units are the same for every thermostat
+    _attr_hvac_modes = HVAC_MODES
+    _attr_precision = DEFAULT_PRECISION
+    _attr_target_temperature_step = PRECISION_HALVES
+    _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    # State is pushed from the tracked entities' state changes
+    _attr_should_poll = False
+
+    # An active heating/cooling action overrides the mode icon unless the thermostat is off
+    _ICONS_BY_ACTION: ClassVar[dict[HVACAction, str]] = {
+        HVACAction.HEATING: "mdi:fire",
+        HVACAction.COOLING: "mdi:snowflake",
+    }
+    _ICONS_BY_MODE: ClassVar[dict[HVACMode, str]] = {
+        HVACMode.OFF: "mdi:thermostat-off",
+        HVACMode.AUTO: "mdi:thermostat-auto",
+        HVACMode.HEAT_COOL: "mdi:sun-snowflake-variant",
+        HVACMode.HEAT: "mdi:radiator",
+        HVACMode.COOL: "mdi:air-conditioner",
+        HVACMode.FAN_ONLY: "mdi:fan-auto",
+    }
+
     def __init__(self, hass: HomeAssistant, config: dict[str, Any], entry_id: str, options: MappingProxyType[str, Any] = MappingProxyType({})) -> None:
         """Initialize the thermostat."""
         self.hass = hass
         self._entry_id = entry_id
-        
-        # Use options if available, otherwise fall back to config
-        if options is None:
-            options = {}
+
+        # Options override the initial config entry data
+        settings = ChainMap(options, config)
         
         # Name and unique ID
-        self._attr_name = options.get(CONF_NAME, config.get(CONF_NAME, "Damper Thermostat"))
+        self._attr_name = settings.get(CONF_NAME, "Damper Thermostat")
         self._attr_unique_id = f"{DOMAIN}_{entry_id}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=self._attr_name,
+            manufacturer="SSalahi",
+            model="Smart Damper Thermostat",
+            sw_version="1.0.0"
+        )
         
         # Entity configurations (can be changed via options)
-        self._temperature_sensor_entity_ids = options.get(CONF_TEMPERATURE_SENSOR, config[CONF_TEMPERATURE_SENSOR])
-        self._humidity_sensor_entity_ids = options.get(CONF_HUMIDITY_SENSOR, config.get(CONF_HUMIDITY_SENSOR))
-        self._actuator_switch_entity_ids = options.get(CONF_ACTUATOR_SWITCH, config[CONF_ACTUATOR_SWITCH])
+        self._temperature_sensor_entity_ids = _as_tuple(settings[CONF_TEMPERATURE_SENSOR])
+        self._humidity_sensor_entity_ids = _as_tuple(settings.get(CONF_HUMIDITY_SENSOR))
+        self._actuator_switch_entity_ids = _as_tuple(settings[CONF_ACTUATOR_SWITCH])
         
         # Handle actuator switches list - use global settings
-        self._actuator_switches_entity_ids = get_global_setting(hass, CONF_GLOBAL_ACTUATOR_SWITCHES, [])
-        if not isinstance(self._actuator_switches_entity_ids, list):
-            self._actuator_switches_entity_ids = [self._actuator_switches_entity_ids] if self._actuator_switches_entity_ids else []
+        self._actuator_switches_entity_ids = _as_tuple(get_global_setting(hass, CONF_GLOBAL_ACTUATOR_SWITCHES, []))
+        # Global switches with a lower priority than each of our actuators, lowest
+        # priority first, which can be opened to close an actuator at the off limit
+        switches = self._actuator_switches_entity_ids
+        self._lower_priority_switches: dict[str, tuple[str, ...]] = {
+            actuator: switches[:switches.index(actuator):-1]
+            for actuator in self._actuator_switch_entity_ids
+            if actuator in switches
+        }
         
         # Max switches off limit - use global settings
         self._max_switches_off = get_global_setting(
             hass, CONF_GLOBAL_MAX_SWITCHES_OFF, DEFAULT_MAX_SWITCHES_OFF
         )
         
-        self._main_thermostat_entity_id = options.get(CONF_MAIN_THERMOSTAT, config.get(CONF_MAIN_THERMOSTAT))
+        self._main_thermostat_entity_id = settings.get(CONF_MAIN_THERMOSTAT)
         
         # Other configuration options
-        self._cold_tolerance = options.get(CONF_COLD_TOLERANCE, config.get(CONF_COLD_TOLERANCE, DEFAULT_TOLERANCE))
-        self._hot_tolerance = options.get(CONF_HOT_TOLERANCE, config.get(CONF_HOT_TOLERANCE, DEFAULT_TOLERANCE))
+        self._cold_tolerance = settings.get(CONF_COLD_TOLERANCE, DEFAULT_TOLERANCE)
+        self._hot_tolerance = settings.get(CONF_HOT_TOLERANCE, DEFAULT_TOLERANCE)
         # Temperature limits - use global settings
         self._attr_min_temp = get_global_setting(hass, CONF_GLOBAL_MIN_TEMP, DEFAULT_MIN_TEMP)
         self._attr_max_temp = get_global_setting(hass, CONF_GLOBAL_MAX_TEMP, DEFAULT_MAX_TEMP)
-        self._attr_target_temperature = options.get(CONF_TARGET_TEMP, config.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP))
-        self._attr_target_temperature_low = options.get(CONF_TARGET_TEMP_LOW, config.get(CONF_TARGET_TEMP_LOW, DEFAULT_TARGET_TEMP_LOW))
-        self._attr_target_temperature_high = options.get(CONF_TARGET_TEMP_HIGH, config.get(CONF_TARGET_TEMP_HIGH, DEFAULT_TARGET_TEMP_HIGH))
-        self._attr_precision = DEFAULT_PRECISION
-        self._attr_target_temperature_step = PRECISION_HALVES
+        self._attr_target_temperature = settings.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP)
+        self._attr_target_temperature_low = settings.get(CONF_TARGET_TEMP_LOW, DEFAULT_TARGET_TEMP_LOW)
+        self._attr_target_temperature_high = settings.get(CONF_TARGET_TEMP_HIGH, DEFAULT_TARGET_TEMP_HIGH)
         
         # Set initial HVAC mode
-        self._attr_hvac_mode = options.get(CONF_INITIAL_HVAC_MODE, config.get(CONF_INITIAL_HVAC_MODE, HVACMode.AUTO))
+        self._attr_hvac_mode = _HVAC_MODE_BY_VALUE.get(
+            settings.get(CONF_INITIAL_HVAC_MODE), HVACMode.AUTO
+        )
         
         # State variables
         self._attr_current_temperature = None
         self._attr_current_humidity = None
         self._attr_hvac_action = HVACAction.OFF
-        self._attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
-        
-        # Supported features and modes
-        self._attr_supported_features = SUPPORT_FLAGS
-            
-        self._attr_hvac_modes = HVAC_MODES
+        self._async_hvac_mode_updated()
+
+        # Diagnostic state attributes, the actuator status follows the actuator switches
+        self._attr_extra_state_attributes = {
+            "actuator_switch": "Close",
+            "cold_tolerance": self._cold_tolerance,
+            "hot_tolerance": self._hot_tolerance,
+        }
         
         # Reverse heat/cool range flag — initial/fallback value before switch entity publishes its state
-        self._initial_reverse_heat_cool_range = options.get(CONF_REVERSE_HEAT_COOL_RANGE, config.get(CONF_REVERSE_HEAT_COOL_RANGE, False))
+        self._initial_reverse_heat_cool_range = settings.get(CONF_REVERSE_HEAT_COOL_RANGE, False)
 
         # Fan mode flags — initial/fallback values before select entities publish their states
-        self._initial_heat_fan_mode = options.get(CONF_HEAT_FAN_MODE, config.get(CONF_HEAT_FAN_MODE, FanMode.AUTO))
-        self._initial_cold_fan_mode = options.get(CONF_COLD_FAN_MODE, config.get(CONF_COLD_FAN_MODE, FanMode.AUTO))
+        self._initial_heat_fan_mode = settings.get(CONF_HEAT_FAN_MODE, FanMode.AUTO)
+        self._initial_cold_fan_mode = settings.get(CONF_COLD_FAN_MODE, FanMode.AUTO)
+
+        # Shared hass.data store and the keys the switch/select entities publish under,
+        # resolved once so the control loop doesn't rebuild them on every read
+        self._domain_data = hass.data[DOMAIN]
+        self._reverse_heat_cool_range_key = f"{entry_id}_reverse_heat_cool_range"
+        self._heat_fan_mode_key = f"{entry_id}_{CONF_HEAT_FAN_MODE}"
+        self._cold_fan_mode_key = f"{entry_id}_{CONF_COLD_FAN_MODE}"
 
         # Control variables
         self._active = False
         self._cur_temp = None
-        self._cur_humidity = None
-        self._temp_lock = asyncio.Lock()
-        self._on_by_us = False
+        self._last_controlled_temp = None
+        # Last valid reading per sensor, kept up to date from the sensor state changes
+        self._temp_values = _SensorAverage()
+        self._humidity_values = _SensorAverage()
+        self._last_control_inputs: tuple[Any, ...] | None = None
+        self._control_running = False
+        self._control_rerun = False
+        # State we expect each of our own toggles to report, so their echo
+        # doesn't re-trigger the control logic
+        self._pending_toggles: dict[str, str] = {}
+        self._actuator_states: dict[str, str] = {}
+        self._actuators_on: set[str] = set()
         self._main_thermostat_target_temperature = self._attr_target_temperature
+        self._main_hvac_mode: HVACMode | None = None
+        self._main_hvac_action = HVACAction.OFF
+        self._write_handle: asyncio.Handle | None = None
+        self._last_written_state: tuple[Any, ...] | None = None
+        self._control_handle: asyncio.TimerHandle | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
         await super().async_added_to_hass()
 
-        # Add listeners for temperature sensors
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, self._temperature_sensor_entity_ids, self._async_sensor_changed
-            )
-        )
-        
-        # Add listener for humidity sensor if configured
-        if self._humidity_sensor_entity_ids:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, self._humidity_sensor_entity_ids, self._async_sensor_changed
+        # Track each group of entities with its own handler: temperature/humidity
+        # sensors, main thermostat and actuator switches. The handlers are plain
+        # callbacks so the event helper can skip job type detection
+        tracked: list[tuple[tuple[str, ...], Callable[[Event[EventStateChangedData]], None]]] = [
+            (self._temperature_sensor_entity_ids, self._async_temperature_sensor_changed),
+            (self._humidity_sensor_entity_ids, self._async_humidity_sensor_changed),
+            (
+                _as_tuple(self._main_thermostat_entity_id),
+                self._async_main_thermostat_changed,
+            ),
+            (self._actuator_switch_entity_ids, self._async_switch_changed),
+        ]
+        for entity_ids, handler in tracked:
+            if entity_ids:
+                self.async_on_remove(
+                    async_track_state_change_event(
+                        self.hass, entity_ids, handler, job_type=HassJobType.Callback
+                    )
                 )
-            )
-        
-        # Add listener for main thermostat if configured
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self._main_thermostat_entity_id], self._async_main_thermostat_changed
-            )
-        )
-
-        # Add listener for actuator switch
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, self._actuator_switch_entity_ids, self._async_switch_changed
-            )
-        )
+        self.async_on_remove(self._async_cancel_pending_write)
+        self.async_on_remove(self._async_cancel_scheduled_control)
 
         # Check if we have a saved state
         old_state = await self.async_get_last_state()
@@ -202,8 +312,10 @@ class DamperThermostat(ClimateEntity, RestoreEntity):
             if old_state.attributes.get(ATTR_TARGET_TEMP_HIGH) is not None:
                 self._attr_target_temperature_high = float(old_state.attributes[ATTR_TARGET_TEMP_HIGH])
 
-            if old_state.state and old_state.state != STATE_UNKNOWN:
-                self._attr_hvac_mode = HVACMode(old_state.state)
+            # Unknown or unsupported states keep the default mode
+            if (mode := _HVAC_MODE_BY_VALUE.get(old_state.state)) is not None:
+                self._attr_hvac_mode = mode
+                self._async_hvac_mode_updated()
 
         else:
             # No previous state, set some defaults
@@ -211,100 +323,216 @@ class DamperThermostat(ClimateEntity, RestoreEntity):
                 self._attr_target_temperature = self.min_temp
             _LOGGER.warning("No previously saved temperature, setting to %s", self._attr_target_temperature)
 
+        states_get = self.hass.states.get
+
         # Set initial temperature and humidity
+        for sensor_id in self._temperature_sensor_entity_ids:
+            self._store_sensor_value(self._temp_values, sensor_id, states_get(sensor_id))
         self._async_update_temp(None)
         if self._humidity_sensor_entity_ids:
+            for sensor_id in self._humidity_sensor_entity_ids:
+                self._store_sensor_value(self._humidity_values, sensor_id, states_get(sensor_id))
             self._async_update_humidity(None)
         
-        # Set initial main thermostat state
-        self._async_update_main_thermostat_state(None)
+        # Set initial main thermostat state, the control pass below covers it
+        if self._main_thermostat_entity_id is not None:
+            self._async_update_main_thermostat_state(
+                states_get(self._main_thermostat_entity_id)
+            )
+        else:
+            _LOGGER.warning(
+                "No main thermostat configured for %s, actuators are only controlled in auto mode",
+                self._attr_name,
+            )
+
+        # Seed the actuator switch states, kept up to date by _async_switch_changed
+        for switch_id in self._actuator_switch_entity_ids:
+            if (state := states_get(switch_id)) is not None:
+                self._async_set_actuator_state(switch_id, state.state)
+
+        # Set initial actuator status
+        self._async_update_actuator_status()
 
         # Register callback so the reverse switch entity can trigger re-control
         self.hass.data[DOMAIN][f"{self._entry_id}_on_reverse_change"] = self._async_control_heating_cooling
 
-        # Call control logic on startup
-        if self.hass.state == "running":
-            await self._async_control_heating_cooling()
-        else:
-            self.hass.bus.async_listen_once(
-                EVENT_HOMEASSISTANT_START, self._async_control_heating_cooling
-            )
+        # Call control logic once Home Assistant has started, right away if it
+        # already has, so the first pass sees the other integrations' entities
+        self.async_on_remove(async_at_started(self.hass, self._async_startup))
+
+    async def _async_startup(self, hass: HomeAssistant) -> None:
+        """Run the first control pass once Home Assistant has started."""
+        await self._async_control_heating_cooling()
     
     @callback
     def _async_update_temp(self, state) -> None:
         """Update thermostat with average temperature from all temperature sensors."""
-        try:
-            # Calculate average temperature
-            avg_temp = self._async_calculate_average_sensor_state(self._temperature_sensor_entity_ids)
-            if not avg_temp:
-                # Only log warning if this is not the initial startup call
-                if state is not None:
-                    _LOGGER.warning("No valid temperature readings from any sensors")
-                return None
-            self._cur_temp = avg_temp
-            self._attr_current_temperature = avg_temp
-        
-        except Exception as ex:
-            _LOGGER.error("Error updating temperature: %s", ex)
+        # Calculate average temperature
+        avg_temp = self._temp_values.average
+        if not avg_temp:
+            # Only log warning if this is not the initial startup call
+            if state is not None:
+                _LOGGER.warning("No valid temperature readings from any sensors")
+            return None
+        self._cur_temp = avg_temp
+        self._attr_current_temperature = avg_temp
 
     @callback
     def _async_update_humidity(self, state) -> None:
         """Update thermostat with latest state from humidity sensors."""
-        try:
-             # Calculate average temperature
-            avg_humidity = self._async_calculate_average_sensor_state(self._humidity_sensor_entity_ids)
-            if not avg_humidity:
-                # Only log warning if this is not the initial startup call
-                if state is not None:
-                    _LOGGER.warning("No valid humidity readings from any sensors")
-                return None
-            self._cur_humidity = int(avg_humidity)
-            self._attr_current_humidity = int(avg_humidity)
-
-        except Exception as ex:
-            _LOGGER.error("Error updating humidities: %s", ex)
+        # Calculate average humidity
+        avg_humidity = self._humidity_values.average
+        if not avg_humidity:
+            # Only log warning if this is not the initial startup call
+            if state is not None:
+                _LOGGER.warning("No valid humidity readings from any sensors")
+            return None
+        self._attr_current_humidity = int(avg_humidity)
 
     @callback
     def _async_update_main_thermostat_state(self, state) -> None:
         """Update thermostat action based on main thermostat state."""
+        if state is None or state.state in _INVALID_STATES:
+            # Control waits until the main thermostat reports a mode again
+            self._main_hvac_mode = None
+            return
+
+        # Keep track of main thermostat's mode and action for the control logic,
+        # an unknown mode disables control and an unknown action counts as off
+        self._main_hvac_mode = _MAIN_HVAC_MODE_BY_VALUE.get(state.state)
+        # Map main thermostat's hvac_action to our hvac_action
+        attrs = state.attributes
+        main_action = _HVAC_ACTION_BY_VALUE.get(attrs.get("hvac_action"), HVACAction.OFF)
+        self._main_hvac_action = main_action
+        self._attr_hvac_action = main_action
+        self._async_update_icon()
+
+        # Keep track of main thermostat's target_temperature, it reports none in
+        # heat_cool mode (and often when off), keep the last one meanwhile
+        target_temp = attrs.get("temperature")
+        if target_temp is None:
+            return
         try:
-            if state is None:
-                state = self.hass.states.get(self._main_thermostat_entity_id)
+            self._main_thermostat_target_temperature = float(target_temp)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "Invalid target temperature %s from main thermostat %s",
+                target_temp,
+                self._main_thermostat_entity_id,
+            )
 
-            if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-                return
+    @callback
+    def _async_schedule_write_ha_state(self) -> None:
+        """Coalesce state writes requested within the same event loop iteration."""
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_soon(self._async_write_pending_state)
 
-            # Map main thermostat's hvac_action to our hvac_action
-            main_action = HVACAction(state.attributes.get("hvac_action", HVACAction.OFF)) if state.attributes else HVACAction.OFF
-            self._attr_hvac_action = main_action
-            # Kepp track of main thermostat's target_temperature
-            self._main_thermostat_target_temperature = float(state.attributes.get("temperature", self._attr_target_temperature))
-            
-            # Update the current thermostat's based on the main thermostat change
-            task = self.hass.async_create_task(self._async_control_heating_cooling())
-            task.add_done_callback(self._handle_control_task_done)
-        except Exception as ex:
-            _LOGGER.error("Error updating main thermostat state: %s", ex)
-            self._attr_hvac_action = HVACAction.OFF
+    @callback
+    def _async_write_pending_state(self) -> None:
+        """Write the state scheduled by _async_schedule_write_ha_state."""
+        self._write_handle = None
+        # Skip the write if nothing shown in the state changed since the last one
+        state = self._state_snapshot()
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        self.async_write_ha_state()
 
     @callback
-    def _async_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
-        """Handle temperature/humidity sensor state changes."""
+    def _async_write_ha_state_now(self) -> None:
+        """Write the state right away, this also covers any pending scheduled write."""
+        self._async_cancel_pending_write()
+        self._last_written_state = self._state_snapshot()
+        self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the values that make up the written state."""
+        return (
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self._attr_current_temperature,
+            self._attr_current_humidity,
+            self._attr_target_temperature,
+            self._attr_target_temperature_low,
+            self._attr_target_temperature_high,
+            self._main_thermostat_target_temperature,
+            self._attr_extra_state_attributes["actuator_switch"],
+        )
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        """Cancel a scheduled state write."""
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    @staticmethod
+    def _store_sensor_value(values: _SensorAverage, sensor_id: str, state) -> bool:
+        """Store the reading of a sensor state, return True if it is valid."""
+        if state is None or state.state in _INVALID_STATES:
+            values.discard(sensor_id)
+            return False
+        try:
+            value = float(state.state)
+        except ValueError as ex:
+            _LOGGER.warning("Unable to parse state from sensor %s: %s", sensor_id, ex)
+            values.discard(sensor_id)
+            return False
+        # nan and inf parse as floats but would poison the average
+        if not math.isfinite(value):
+            _LOGGER.warning("Ignoring non-finite state %s from sensor %s", state.state, sensor_id)
+            values.discard(sensor_id)
+            return False
+        values.set(sensor_id, value)
+        return True
+
+    @classmethod
+    def _is_new_sensor_reading(
+        cls, values: _SensorAverage, event: Event[EventStateChangedData]
+    ) -> bool:
+        """Store the reading of a sensor event, return True if it is new and valid."""
         new_state = event.data["new_state"]
-        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        # A repeated reading (e.g. attribute-only update) leaves the averages unchanged
+        old_state = event.data["old_state"]
+        if (
+            new_state is not None
+            and old_state is not None
+            and old_state.state == new_state.state
+        ):
+            return False
+
+        return cls._store_sensor_value(values, event.data["entity_id"], new_state)
+
+    @callback
+    def _async_temperature_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle temperature sensor state changes."""
+        if not self._is_new_sensor_reading(self._temp_values, event):
             return
 
-        entity_id = event.data["entity_id"]
-        
-        if entity_id in self._temperature_sensor_entity_ids:
-            self._async_update_temp(new_state)
-        elif self._humidity_sensor_entity_ids is not None and entity_id in self._humidity_sensor_entity_ids:
-            self._async_update_humidity(new_state)
-            
-        self.async_write_ha_state()
-        # Use async_create_task with proper error handling
-        task = self.hass.async_create_task(self._async_control_heating_cooling())
-        task.add_done_callback(self._handle_control_task_done)
+        self._async_update_temp(event.data["new_state"])
+        self._async_schedule_write_ha_state()
+
+        # Skip the control pass while the temperature stays within a fraction
+        # of the tolerance band since the last evaluated temperature
+        if (
+            self._last_controlled_temp is not None
+            and self._cur_temp is not None
+            and abs(self._cur_temp - self._last_controlled_temp)
+            < min(self._cold_tolerance, self._hot_tolerance) / 4
+        ):
+            return
+
+        self._async_schedule_control()
+
+    @callback
+    def _async_humidity_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle humidity sensor state changes."""
+        if not self._is_new_sensor_reading(self._humidity_values, event):
+            return
+
+        self._async_update_humidity(event.data["new_state"])
+        # Humidity does not take part in the control decision
+        self._async_schedule_write_ha_state()
 
     @callback
     def _async_main_thermostat_changed(self, event: Event[EventStateChangedData]) -> None:
@@ -312,208 +540,375 @@ class DamperThermostat(ClimateEntity, RestoreEntity):
         new_state = event.data["new_state"]
         if new_state is None:
             return
-            
+
+        # Only the mode, action and target temperature feed the control logic,
+        # ignore updates of the other attributes (e.g. current temperature)
+        old_state = event.data["old_state"]
+        if old_state is not None and old_state.state == new_state.state:
+            old_attrs = old_state.attributes
+            new_attrs = new_state.attributes
+            if old_attrs.get("hvac_action") == new_attrs.get(
+                "hvac_action"
+            ) and old_attrs.get("temperature") == new_attrs.get("temperature"):
+                return
+
         self._async_update_main_thermostat_state(new_state)
-        self.async_write_ha_state()
+        self._async_schedule_write_ha_state()
+
+        # Update the current thermostat's based on the main thermostat change
+        if new_state.state not in _INVALID_STATES:
+            self._async_schedule_control()
 
     @callback
     def _async_switch_changed(self, event) -> None:
         """Handle actuator switch state changes."""
         new_state = event.data["new_state"]
-        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        switch_id = event.data["entity_id"]
+        if new_state is None:
+            self._pending_toggles.pop(switch_id, None)
+            self._async_set_actuator_state(switch_id, None)
+            self._async_update_actuator_status()
+            self._async_schedule_write_ha_state()
             return
 
-        self.async_write_ha_state()
-        if not self._on_by_us:
+        self._async_set_actuator_state(switch_id, new_state.state)
+        if new_state.state in _INVALID_STATES:
+            # An unavailable switch no longer counts as open, keep the status in sync
+            self._pending_toggles.pop(switch_id, None)
+            self._async_update_actuator_status()
+            self._async_schedule_write_ha_state()
+            return
+
+        # Attribute-only updates leave the actuator status unchanged and are not
+        # the echo of one of our own commands
+        old_state = event.data["old_state"]
+        if old_state is not None and old_state.state == new_state.state:
+            return
+
+        self._async_update_actuator_status()
+        self._async_schedule_write_ha_state()
+        if self._pending_toggles.pop(switch_id, None) != new_state.state:
             # If the switch was turned on/off manually, we need to update our control logic
-            task = self.hass.async_create_task(self._async_control_heating_cooling())
-            task.add_done_callback(self._handle_control_task_done)
-        
-        # Reset the flag after processing
-        self._on_by_us = False
+            self._async_schedule_control()
                                 
-    async def _async_control_heating_cooling(self, time=None) -> None:
+    @callback
+    def _async_set_actuator_state(self, switch_id: str, state: str | None) -> None:
+        """Record the state of an actuator switch, None once the switch is removed."""
+        if state is None:
+            self._actuator_states.pop(switch_id, None)
+        else:
+            self._actuator_states[switch_id] = state
+        if state == "on":
+            self._actuators_on.add(switch_id)
+        else:
+            self._actuators_on.discard(switch_id)
+
+    @callback
+    def _async_schedule_control(self) -> None:
+        """Run the control logic shortly, once for a burst of state changes."""
+        # A run is already scheduled and will see this change, keep its timer
+        # so a steady stream of changes cannot keep postponing it
+        if self._control_handle is not None:
+            return
+        self._control_handle = self.hass.loop.call_later(
+            _CONTROL_DEBOUNCE_DELAY, self._async_run_scheduled_control
+        )
+
+    @callback
+    def _async_run_scheduled_control(self) -> None:
+        """Run the control logic scheduled by _async_schedule_control in a background task."""
+        self._control_handle = None
+        # Errors are logged by the control logic itself
+        self.hass.async_create_background_task(
+            self._async_control_heating_cooling(),
+            name=f"{DOMAIN}_control_{self.entity_id}",
+            eager_start=True,
+        )
+
+    @callback
+    def _async_cancel_scheduled_control(self) -> None:
+        """Cancel a scheduled control run."""
+        if self._control_handle is not None:
+            self._control_handle.cancel()
+            self._control_handle = None
+
+    @callback
+    def _async_update_actuator_status(self) -> None:
+        """Update the actuator status attribute from the actuator switch states."""
+        self._attr_extra_state_attributes["actuator_switch"] = (
+            "Open" if self._actuators_on else "Close"
+        )
+
+    async def _async_control_heating_cooling(self) -> None:
         """Check if we need to turn heating/cooling on or off."""
         try:
-            async with self._temp_lock:
-                if not self._active and None not in (self._cur_temp, self._attr_target_temperature):
-                    self._active = True
-                    _LOGGER.info(
-                        "Obtained current and target temperature. "
-                        "Damper Thermostat active. %s, %s",
-                        self._cur_temp,
-                        self._attr_target_temperature,
-                    )
+            if not self._active and None not in (self._cur_temp, self._attr_target_temperature):
+                self._active = True
+                _LOGGER.info(
+                    "Obtained current and target temperature. "
+                    "Damper Thermostat active. %s, %s",
+                    self._cur_temp,
+                    self._attr_target_temperature,
+                )
 
-                if not self._active or self._attr_hvac_mode == HVACMode.OFF:
-                    return
+            # Nothing to control
+            if not self._active or self._attr_hvac_mode is HVACMode.OFF:
+                return
 
-                await self._async_control_based_on_main_thermostat()
+            # Only one control pass runs at a time, a request arriving during a pass
+            # is picked up by running one more pass once it finishes
+            if self._control_running:
+                self._control_rerun = True
+                return
+
+            self._control_running = True
+            try:
+                while True:
+                    self._control_rerun = False
+                    # The decision only depends on these inputs, skip the pass if none changed
+                    control_inputs = self._control_inputs()
+                    if control_inputs != self._last_control_inputs:
+                        # Only remember the inputs once the actuator reached the decided
+                        # state, a refused or failed command is retried on the next request
+                        if await self._async_control_based_on_main_thermostat():
+                            self._last_control_inputs = control_inputs
+                            self._last_controlled_temp = self._cur_temp
+                        else:
+                            self._async_reset_control_memo()
+                    if not self._control_rerun or self._attr_hvac_mode is HVACMode.OFF:
+                        break
+            finally:
+                self._control_running = False
                 
         except Exception as ex:
             _LOGGER.error("Error in control heating/cooling: %s", ex)
+            self._async_reset_control_memo()
 
-    async def _async_control_based_on_main_thermostat(self) -> None:
-        """Control actuator based on main thermostat state and our temperature."""
-        try:
-            main_state = self.hass.states.get(self._main_thermostat_entity_id)
-            if main_state is None:
-                _LOGGER.warning("Main thermostat %s not found", self._main_thermostat_entity_id)
-                return
-                
-            main_action = HVACAction(main_state.attributes.get("hvac_action", HVACAction.OFF))
-            main_mode = HVACMode(main_state.state)
-            
-            # Deciding based on the low/high target temp and main thermostat current state
-            # and our temperature to know if actuator needs to be closed or not
-            should_deactivate = False
-            should_deactivate_for_fan = False
-            enough_cold = False
-            enough_heat = False
-            
-            # The heat/cool is opposite of each other, so we need to deactivate
-            if self._attr_hvac_mode == HVACMode.COOL and main_mode == HVACMode.HEAT:
-                should_deactivate = True
-            if self._attr_hvac_mode == HVACMode.HEAT and main_mode == HVACMode.COOL:
-                should_deactivate = True
-
-            # Fan Mode checks
-            if main_mode == HVACMode.HEAT and main_action == HVACAction.FAN:
-                if self._heat_fan_mode == FanMode.OFF:
-                    should_deactivate_for_fan = True
-                elif self._heat_fan_mode == FanMode.SMART:
-                    if self._reverse_heat_cool_range and self._attr_target_temperature_high <= (self._cur_temp - self._hot_tolerance):
-                        should_deactivate_for_fan = True
-                    elif not self._reverse_heat_cool_range and self._attr_target_temperature_low <= (self._cur_temp - self._hot_tolerance):
-                        should_deactivate_for_fan = True
-            if main_mode == HVACMode.COOL and main_action == HVACAction.FAN:
-                if self._cold_fan_mode == FanMode.OFF:
-                    should_deactivate_for_fan = True
-                elif self._cold_fan_mode == FanMode.SMART:
-                    if self._reverse_heat_cool_range and self._attr_target_temperature_low >= (self._cur_temp + self._cold_tolerance):
-                        should_deactivate_for_fan = True
-                    elif not self._reverse_heat_cool_range and self._attr_target_temperature_high >= (self._cur_temp + self._cold_tolerance):
-                        should_deactivate_for_fan = True
-            should_deactivate = should_deactivate or should_deactivate_for_fan
-
-            # Handle heat_cool mode
-            if self._attr_hvac_mode == HVACMode.HEAT_COOL:
-                if main_mode == HVACMode.COOL and main_action == HVACAction.COOLING:
-                    if self._reverse_heat_cool_range:
-                        enough_cold = self._attr_target_temperature_low >= (self._cur_temp + self._cold_tolerance)
-                    else:
-                        enough_cold = self._attr_target_temperature_high >= (self._cur_temp + self._cold_tolerance)
-                if main_mode == HVACMode.HEAT and main_action in [HVACAction.HEATING, HVACAction.PREHEATING]:
-                    if self._reverse_heat_cool_range:
-                        enough_heat = self._attr_target_temperature_high <= (self._cur_temp - self._hot_tolerance)
-                    else:
-                        enough_heat = self._attr_target_temperature_low <= (self._cur_temp - self._hot_tolerance)
-            should_deactivate = should_deactivate or enough_cold or enough_heat
-
-            # Handle heat and cool modes
-            if self._attr_hvac_mode == HVACMode.COOL and main_action == HVACAction.COOLING:
-                enough_cold = self._attr_target_temperature >= (self._cur_temp + self._cold_tolerance)
-            if self._attr_hvac_mode == HVACMode.HEAT and main_action in [HVACAction.HEATING, HVACAction.PREHEATING]:
-                enough_heat = self._attr_target_temperature <= (self._cur_temp - self._hot_tolerance)
-            should_deactivate = should_deactivate or enough_cold or enough_heat
-
-            # Auto mode will always keep the actuator on
-            if self._attr_hvac_mode == HVACMode.AUTO:
-                should_deactivate = False
-
-            current_device_active = await self._async_is_device_active()
-            if should_deactivate and current_device_active:
-                _LOGGER.info("Thermostat Control: Conditions not met, turning off actuator")
-                await self._async_actuators_turn_off()
-            elif not should_deactivate and not current_device_active:
+    @callback
+    def _async_reset_control_memo(self) -> None:
+        """Forget the last control pass so the next request runs a full pass."""
+        self._last_control_inputs = None
+        self._last_controlled_temp = None
+
+    def _control_inputs(self) -> tuple[Any, ...]:
+        """Return the values the actuator decision depends on."""
+        return (
+            self._attr_hvac_mode,
+            self._cur_temp,
+            self._attr_target_temperature,
+            self._attr_target_temperature_low,
+            self._attr_target_temperature_high,
+            self._main_hvac_mode,
+            self._main_hvac_action,
+            self._reverse_heat_cool_range,
+            self._heat_fan_mode,
+            self._cold_fan_mode,
+            bool(self._actuators_on),
+        )
+
+    async def _async_control_based_on_main_thermostat(self) -> bool:
+        """Control actuator based on main thermostat state, return False if it didn't reach the decided state."""
+        # Errors are logged by _async_control_heating_cooling
+        # The decision for the current hvac mode, bound on hvac mode changes
+        should_deactivate = self._should_deactivate
+
+        # Auto mode will always keep the actuator on
+        if should_deactivate is None:
+            if not self._async_is_device_active():
                 _LOGGER.info("Thermostat Control: Turning on actuator")
-                await self._async_actuators_turn_on()
-        except Exception as ex:
-            _LOGGER.error("Error in main thermostat control: %s", ex)
+                return await self._async_actuators_turn_on()
+            return True
 
-    async def _async_is_device_active(self) -> bool:
-        """Check if the actuator switch is currently on."""
-        try:
-            for actuator in self._actuator_switch_entity_ids:
-                state = self.hass.states.get(actuator)
-                if state is not None and state.state == "on":
-                    return True
-            return False
-        except Exception as ex:
-            _LOGGER.error("Error checking device state: %s", ex)
+        # Without a main thermostat there is nothing to decide from, leave the
+        # actuators as they are
+        if self._main_thermostat_entity_id is None:
+            return True
+
+        # The main thermostat state is cached from its state changes, look it
+        # up once if no valid state has been seen yet
+        main_mode = self._main_hvac_mode
+        if main_mode is None:
+            self._async_update_main_thermostat_state(
+                self.hass.states.get(self._main_thermostat_entity_id)
+            )
+            # Nothing to decide until the main thermostat reports a mode
+            if (main_mode := self._main_hvac_mode) is None:
+                _LOGGER.warning("Main thermostat %s not found", self._main_thermostat_entity_id)
+                return True
+
+        # Deciding based on the low/high target temp and main thermostat current state
+        # and our temperature to know if actuator needs to be closed or not
+        cur_temp = self._cur_temp
+        deactivate = should_deactivate(
+            main_mode,
+            self._main_hvac_action,
+            cur_temp - self._hot_tolerance,
+            cur_temp + self._cold_tolerance,
+        )
+
+        current_device_active = self._async_is_device_active()
+        if deactivate and current_device_active:
+            _LOGGER.info("Thermostat Control: Conditions not met, turning off actuator")
+            return await self._async_actuators_turn_off()
+        if not deactivate and not current_device_active:
+            _LOGGER.info("Thermostat Control: Turning on actuator")
+            return await self._async_actuators_turn_on()
+        return True
+
+    def _should_deactivate_heat(
+        self, main_mode: HVACMode, main_action: HVACAction, heat_threshold: float, cool_threshold: float
+    ) -> bool:
+        """Return True if the actuator should be closed in heat mode."""
+        # The heat/cool is opposite of each other, so we need to deactivate
+        if main_mode is HVACMode.COOL:
+            return True
+        if main_action in _HEATING_ACTIONS:
+            return self._attr_target_temperature <= heat_threshold
+        return self._should_deactivate_for_fan(main_mode, main_action, heat_threshold, cool_threshold)
+
+    def _should_deactivate_cool(
+        self, main_mode: HVACMode, main_action: HVACAction, heat_threshold: float, cool_threshold: float
+    ) -> bool:
+        """Return True if the actuator should be closed in cool mode."""
+        # The heat/cool is opposite of each other, so we need to deactivate
+        if main_mode is HVACMode.HEAT:
+            return True
+        if main_action is HVACAction.COOLING:
+            return self._attr_target_temperature >= cool_threshold
+        return self._should_deactivate_for_fan(main_mode, main_action, heat_threshold, cool_threshold)
+
+    def _should_deactivate_heat_cool(
+        self, main_mode: HVACMode, main_action: HVACAction, heat_threshold: float, cool_threshold: float
+    ) -> bool:
+        """Return True if the actuator should be closed in heat_cool mode."""
+        if main_mode is HVACMode.COOL and main_action is HVACAction.COOLING:
+            if self._reverse_heat_cool_range:
+                return self._attr_target_temperature_low >= cool_threshold
+            return self._attr_target_temperature_high >= cool_threshold
+        if main_mode is HVACMode.HEAT and main_action in _HEATING_ACTIONS:
+            if self._reverse_heat_cool_range:
+                return self._attr_target_temperature_high <= heat_threshold
+            return self._attr_target_temperature_low <= heat_threshold
+        return self._should_deactivate_for_fan(main_mode, main_action, heat_threshold, cool_threshold)
+
+    def _should_deactivate_for_fan(
+        self, main_mode: HVACMode, main_action: HVACAction, heat_threshold: float, cool_threshold: float
+    ) -> bool:
+        """Return True if the actuator should be closed while the main thermostat only runs its fan."""
+        if main_action is not HVACAction.FAN:
             return False
-    
-    def _async_calculate_average_sensor_state(self, sensor_ids) -> float | None:
-        """Calculate the average state of sensors."""
-        states = []
-        for sensor_id in sensor_ids:
-            sensor_state = self.hass.states.get(sensor_id)
-            if sensor_state is not None and sensor_state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-                try:
-                    states.append(float(sensor_state.state))
-                except ValueError as ex:
-                    _LOGGER.warning("Unable to parse state from sensor %s: %s", sensor_id, ex)
-
-        if not states:
-            return None
+        if main_mode is HVACMode.HEAT:
+            heat_fan_mode = self._heat_fan_mode
+            if heat_fan_mode == FanMode.OFF:
+                return True
+            if heat_fan_mode == FanMode.SMART:
+                if self._reverse_heat_cool_range:
+                    return self._attr_target_temperature_high <= heat_threshold
+                return self._attr_target_temperature_low <= heat_threshold
+        elif main_mode is HVACMode.COOL:
+            cold_fan_mode = self._cold_fan_mode
+            if cold_fan_mode == FanMode.OFF:
+                return True
+            if cold_fan_mode == FanMode.SMART:
+                if self._reverse_heat_cool_range:
+                    return self._attr_target_temperature_low >= cool_threshold
+                return self._attr_target_temperature_high >= cool_threshold
+        return False
 
-        return sum(states) / len(states)
+    @callback
+    def _async_is_device_active(self) -> bool:
+        """Check if the actuator switch is currently on."""
+        return bool(self._actuators_on)
     
-    async def _async_get_actuator_switches_status(self) -> dict[str, str]:
+    @callback
+    def _async_get_actuator_switches_status(self) -> dict[str, str]:
         """Get the current status of all actuator switches."""
-        try:
-            status = {}
-            for switch_id in self._actuator_switches_entity_ids:
-                state = self.hass.states.get(switch_id)
-                if state is not None:
-                    status[switch_id] = state.state
-                else:
-                    status[switch_id] = "unavailable"
-            return status
-        except Exception as ex:
-            _LOGGER.error("Error getting actuator switches status: %s", ex)
-            return {}
+        status = {}
+        states_get = self.hass.states.get
+        for switch_id in self._actuator_switches_entity_ids:
+            state = states_get(switch_id)
+            if state is not None:
+                status[switch_id] = state.state
+            else:
+                status[switch_id] = "unavailable"
+        return status
 
-    async def _async_actuators_turn_on(self) -> None:
-        """Turn actuator on."""
+    async def _async_actuators_turn_on(self) -> bool:
+        """Turn actuator on, return False if the service call failed."""
+        # Skip actuators that are already open
+        actuators = [
+            actuator
+            for actuator in self._actuator_switch_entity_ids
+            if self._actuator_states.get(actuator) != "on"
+        ]
+        if not actuators:
+            return True
         try:
-            for actuator in self._actuator_switch_entity_ids: 
-                data = {"entity_id": actuator}
-                self._on_by_us = True
-                await self.hass.services.async_call("switch", SERVICE_TURN_ON, data, blocking=False)
-                _LOGGER.info("Turned on my actuator switch %s", actuator)
-        except Exception as ex:
+            # Open all of them with a single service call
+            await self._async_toggle_actuators(SERVICE_TURN_ON, actuators, "on")
+            _LOGGER.info("Turned on my actuator switches %s", ", ".join(actuators))
+        except HomeAssistantError as ex:
             _LOGGER.error("Error turning on actuator: %s", ex)
-            self._on_by_us = False
+            return False
+        return True
 
-    async def _async_actuators_turn_off(self) -> None:
+    async def _async_toggle_actuators(self, service: str, actuators: list[str], expected_state: str) -> None:
+        """Call a switch service on our actuators, recording the state their echo should report."""
+        for actuator in actuators:
+            self._pending_toggles[actuator] = expected_state
+        try:
+            await self.hass.services.async_call("switch", service, {"entity_id": actuators}, blocking=False)
+        except Exception:
+            # A failed call produces no echo, so the next change of these
+            # switches must not be taken for one
+            for actuator in actuators:
+                self._pending_toggles.pop(actuator, None)
+            raise
+
+    async def _async_actuators_turn_off(self) -> bool:
+        """Turn actuators off, return False if any of them couldn't be closed."""
+        # Snapshot the global switches once, _async_actuator_turn_off keeps it
+        # up to date with the switches it toggles
+        switches_status = self._async_get_actuator_switches_status()
+        off_count = sum(1 for status in switches_status.values() if status == "off")
+        all_closed = True
         for actuator in self._actuator_switch_entity_ids:
-            await self._async_actuator_turn_off(actuator)
+            off_count, closed = await self._async_actuator_turn_off(actuator, switches_status, off_count)
+            all_closed = all_closed and closed
+        return all_closed
     
-    async def _async_actuator_turn_off(self, actuator_switch_entity_id) -> None:
-        """Turn actuator off."""
+    async def _async_actuator_turn_off(
+        self, actuator_switch_entity_id, switches_status: dict[str, str], off_count: int
+    ) -> tuple[int, bool]:
+        """Turn actuator off, return the updated count of closed switches and whether it is closed."""
+        current_off_count = off_count
         try:
+            # Nothing to do if the actuator is already closed
+            if self._actuator_states.get(actuator_switch_entity_id) == "off":
+                return off_count, True
+
             # Check if we can turn off more switches
-            switches_status = await self._async_get_actuator_switches_status()
-            current_off_count = sum(1 for status in switches_status.values() if status == "off")
             if current_off_count < self._max_switches_off:
-                data = {"entity_id": actuator_switch_entity_id}
-                self._on_by_us = True
-                await self.hass.services.async_call("switch", SERVICE_TURN_OFF, data, blocking=False)
+                await self._async_toggle_actuators(SERVICE_TURN_OFF, [actuator_switch_entity_id], "off")
+                # Only the global switches count towards the off limit
+                if (
+                    actuator_switch_entity_id in switches_status
+                    and switches_status[actuator_switch_entity_id] != "off"
+                ):
+                    switches_status[actuator_switch_entity_id] = "off"
+                    off_count += 1
                 _LOGGER.info("Turned off my actuator switch %s.",actuator_switch_entity_id)
-                return
+                return off_count, True
             
-            # Find my position in the priority list
-            try:
-                my_position = self._actuator_switches_entity_ids.index(actuator_switch_entity_id)
-            except ValueError:
+            # Find the switches below mine in the priority list
+            lower_priority_switches = self._lower_priority_switches.get(actuator_switch_entity_id)
+            if lower_priority_switches is None:
                 _LOGGER.error("My actuator switch %s not found in actuator_switches list", actuator_switch_entity_id)
-                return
+                return off_count, False
             
             # Look for a lower priority switch that's currently off to turn ON first
             lower_priority_switch_to_turn_on = None
-            for i in range(len(self._actuator_switches_entity_ids) - 1, my_position, -1):
-                switch_id = self._actuator_switches_entity_ids[i]
+            for switch_id in lower_priority_switches:
                 if switches_status.get(switch_id) == "off":
                     lower_priority_switch_to_turn_on = switch_id
                     break
@@ -524,168 +919,151 @@ class DamperThermostat(ClimateEntity, RestoreEntity):
                     "Cannot turn off actuator %s: no lower priority switch available to turn on",
                     actuator_switch_entity_id
                 )
-                return
+                return off_count, False
             
             # Turn ON the lower priority switch first
             data = {"entity_id": lower_priority_switch_to_turn_on}
             await self.hass.services.async_call("switch", SERVICE_TURN_ON, data, blocking=False)
+            switches_status[lower_priority_switch_to_turn_on] = "on"
+            off_count -= 1
             
             # Now turn OFF my own switch
-            data = {"entity_id": actuator_switch_entity_id}
-            self._on_by_us = True
-            await self.hass.services.async_call("switch", SERVICE_TURN_OFF, data, blocking=False)
+            await self._async_toggle_actuators(SERVICE_TURN_OFF, [actuator_switch_entity_id], "off")
+            if (
+                actuator_switch_entity_id in switches_status
+                and switches_status[actuator_switch_entity_id] != "off"
+            ):
+                switches_status[actuator_switch_entity_id] = "off"
+                off_count += 1
             _LOGGER.info(
                 "Turned off my actuator switch %s after turning on lower priority switch (switches off: %d/%d)",
                 actuator_switch_entity_id,
                 current_off_count,
                 self._max_switches_off
             )
-        except Exception as ex:
+        except HomeAssistantError as ex:
             _LOGGER.error("Error turning off actuator: %s", ex)
-            self._on_by_us = False
+            return off_count, False
+        return off_count, True
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set hvac mode."""
-        if hvac_mode == HVACMode.OFF:
-            self._attr_hvac_mode = HVACMode.OFF
-            if await self._async_is_device_active():
+        if hvac_mode not in _HVAC_MODE_BY_VALUE:
+            _LOGGER.error("Unsupported hvac mode: %s", hvac_mode)
+            return
+        hvac_mode = _HVAC_MODE_BY_VALUE[hvac_mode]
+        # Nothing to do when the frontend re-sends the current mode
+        if hvac_mode is self._attr_hvac_mode:
+            return
+
+        self._attr_hvac_mode = hvac_mode
+        self._async_hvac_mode_updated()
+        if hvac_mode is HVACMode.OFF:
+            if self._async_is_device_active():
                 await self._async_actuators_turn_off()
         else:
-            self._attr_hvac_mode = hvac_mode
             await self._async_control_heating_cooling()
         # Ensure we update the display
-        self.async_write_ha_state()
+        self._async_write_ha_state_now()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         # Handle single temperature setpoint
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is not None and self.hvac_mode is not HVACMode.AUTO:
+        if temperature is not None and self._attr_hvac_mode is not HVACMode.AUTO:
             self._attr_target_temperature = temperature
         
         # Handle dual temperature setpoints for AUTO and HEAT_COOL modes
         target_temp_low = kwargs.get(ATTR_TARGET_TEMP_LOW)
-        if target_temp_low is not None and self.hvac_mode == HVACMode.HEAT_COOL:
+        if target_temp_low is not None and self._attr_hvac_mode is HVACMode.HEAT_COOL:
             self._attr_target_temperature_low = target_temp_low
         
         target_temp_high = kwargs.get(ATTR_TARGET_TEMP_HIGH)
-        if target_temp_high is not None and self.hvac_mode == HVACMode.HEAT_COOL:
+        if target_temp_high is not None and self._attr_hvac_mode is HVACMode.HEAT_COOL:
             self._attr_target_temperature_high = target_temp_high
         
         # Only proceed if we actually got a temperature to set
         if any(temp is not None for temp in [temperature, target_temp_low, target_temp_high]):
             await self._async_control_heating_cooling()
-            self.async_write_ha_state()
+            self._async_write_ha_state_now()
 
-    @callback
-    def _handle_control_task_done(self, task) -> None:
-        """Handle completion of control task."""
-        if task.exception():
-            _LOGGER.error("Control task failed: %s", task.exception())
-    
     @property
     def _reverse_heat_cool_range(self) -> bool:
         """Return current value of the Reverse Heat/Cool Range toggle from hass.data."""
-        return self.hass.data[DOMAIN].get(
-            f"{self._entry_id}_reverse_heat_cool_range",
+        return self._domain_data.get(
+            self._reverse_heat_cool_range_key,
             self._initial_reverse_heat_cool_range,
         )
 
     @property
     def _heat_fan_mode(self) -> str:
         """Return current value of the Heat Fan Mode select from hass.data ('Auto' or 'Off')."""
-        return self.hass.data[DOMAIN].get(
-            f"{self._entry_id}_{CONF_HEAT_FAN_MODE}",
+        return self._domain_data.get(
+            self._heat_fan_mode_key,
             self._initial_heat_fan_mode,
         )
 
     @property
     def _cold_fan_mode(self) -> str:
         """Return current value of the Cold Fan Mode select from hass.data ('Auto' or 'Off')."""
-        return self.hass.data[DOMAIN].get(
-            f"{self._entry_id}_{CONF_COLD_FAN_MODE}",
+        return self._domain_data.get(
+            self._cold_fan_mode_key,
             self._initial_cold_fan_mode,
         )
 
-    @property
-    def supported_features(self) -> float | None:
-        """Return supported feature based on HVACMode"""
-        if self.hvac_mode == HVACMode.HEAT_COOL:
-            return self._attr_supported_features
-        return ClimateEntityFeature.TARGET_TEMPERATURE
-    
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        if self.hvac_mode in [HVACMode.COOL, HVACMode.HEAT]:
+        if self._attr_hvac_mode in _SINGLE_TEMP_MODES:
             return self._attr_target_temperature
-        elif self.hvac_mode == HVACMode.AUTO: 
+        elif self._attr_hvac_mode is HVACMode.AUTO: 
             return self._main_thermostat_target_temperature
         return None
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the highbound target temperature we try to reach."""
-        if self.hvac_mode in [HVACMode.HEAT_COOL]:
+        if self._attr_hvac_mode is HVACMode.HEAT_COOL:
             return self._attr_target_temperature_high
         return None
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the lowbound target temperature we try to reach."""
-        if self.hvac_mode in [HVACMode.HEAT_COOL]:
+        if self._attr_hvac_mode is HVACMode.HEAT_COOL:
             return self._attr_target_temperature_low
         return None
 
-    @property
-    def icon(self):
-        """Return the icon based on current HVAC state."""
-        # Dynamic icons based on mode and action
-        if self._attr_hvac_mode == HVACMode.OFF:
-            return "mdi:thermostat-off"
-        elif self._attr_hvac_action == HVACAction.HEATING:
-            return "mdi:fire"
-        elif self._attr_hvac_action == HVACAction.COOLING:
-            return "mdi:snowflake"
-        elif self._attr_hvac_mode == HVACMode.AUTO:
-            if self._attr_hvac_action == HVACAction.IDLE:
-                return "mdi:thermostat-auto"
-            else:
-                return "mdi:thermostat-auto"
-        elif self._attr_hvac_mode == HVACMode.HEAT_COOL:
-            return "mdi:sun-snowflake-variant"
-        elif self._attr_hvac_mode == HVACMode.HEAT:
-            return "mdi:radiator"
-        elif self._attr_hvac_mode == HVACMode.COOL:
-            return "mdi:air-conditioner"
-        elif self._attr_hvac_mode == HVACMode.FAN_ONLY:
-            return "mdi:fan-auto"
+    @callback
+    def _async_hvac_mode_updated(self) -> None:
+        """Update the control decision, supported features and icon after a hvac mode change."""
+        hvac_mode = self._attr_hvac_mode
+        # Auto mode keeps the actuator on without a decision, modes without a
+        # decision of their own only check the main thermostat's fan
+        if hvac_mode is HVACMode.AUTO:
+            self._should_deactivate = None
         else:
-            return "mdi:thermostat"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the diagnostic state attributes."""
-        actuator_status = "Close"
-        for switch_id in self._actuator_switch_entity_ids:
-            state = self.hass.states.get(switch_id)
-            if state is not None and state.state == "on":
-                actuator_status = "Open"
-                break
+            self._should_deactivate = {
+                HVACMode.HEAT: self._should_deactivate_heat,
+                HVACMode.COOL: self._should_deactivate_cool,
+                HVACMode.HEAT_COOL: self._should_deactivate_heat_cool,
+            }.get(hvac_mode, self._should_deactivate_for_fan)
 
-        return {
-            "actuator_switch": actuator_status,
-            "cold_tolerance": self._cold_tolerance,
-            "hot_tolerance": self._hot_tolerance,
-        }
+        # Only heat_cool mode uses the target temperature range
+        if hvac_mode is HVACMode.HEAT_COOL:
+            self._attr_supported_features = SUPPORT_FLAGS
+        else:
+            self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+        self._async_update_icon()
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this thermostat."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name=self._attr_name,
-            manufacturer="SSalahi",
-            model="Smart Damper Thermostat",
-            sw_version="1.0.0"
-        )
+    @callback
+    def _async_update_icon(self) -> None:
+        """Update the icon from the current hvac mode and action."""
+        # Dynamic icons based on mode and action
+        hvac_mode = self._attr_hvac_mode
+        if hvac_mode is not HVACMode.OFF and (
+            icon := self._ICONS_BY_ACTION.get(self._attr_hvac_action)
+        ):
+            self._attr_icon = icon
+        else:
+            self._attr_icon = self._ICONS_BY_MODE.get(hvac_mode, "mdi:thermostat")
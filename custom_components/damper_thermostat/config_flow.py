@@ -38,7 +38,6 @@ from .const import (
     DEFAULT_TARGET_TEMP,
     DEFAULT_TARGET_TEMP_LOW,
     DEFAULT_TARGET_TEMP_HIGH,
-    DEFAULT_PRECISION,
     DEFAULT_MAX_SWITCHES_OFF,
 )
 
@@ -103,18 +102,16 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 async def check_inside_global_actuator_switches(
         hass: HomeAssistant, new_actuator_switches: list[str]
         ) -> dict[str, str]:
-    """Update global actuator switches list with new switches if they don't exist."""
+    """Check that the new actuator switches are all in the global actuator switches list."""
     
     errors = {}
 
     # Get current global actuator switches
     current_global_switches = get_global_setting(hass, CONF_GLOBAL_ACTUATOR_SWITCHES, [])
     
-    # Add new switches that don't already exist
-    updated_global_switches = list(current_global_switches)
-    for switch in new_actuator_switches:
-        if switch not in updated_global_switches:
-            errors[CONF_ACTUATOR_SWITCH] = "actuator_switch_not_in_global"
+    # Every new switch must already be one of the global switches
+    if not set(current_global_switches).issuperset(new_actuator_switches):
+        errors[CONF_ACTUATOR_SWITCH] = "actuator_switch_not_in_global"
 
     return errors
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -63,6 +62,7 @@ class DamperThermostatHeatFanModeSelect(SelectEntity, RestoreEntity):
     def __init__(self, entry_id: str, initial_value: str) -> None:
         """Initialize the select."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{CONF_HEAT_FAN_MODE}"
         self._attr_name = "Heat Fan Mode"
         self._attr_current_option = initial_value if initial_value in FAN_MODE_OPTIONS else FanMode.AUTO
@@ -108,13 +108,6 @@ class DamperThermostatHeatFanModeSelect(SelectEntity, RestoreEntity):
         """Return the current option."""
         return self._attr_current_option
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
-
     @property
     def icon(self):
         return "mdi:fan" if self._attr_current_option == FanMode.AUTO else "mdi:fan-off"
@@ -130,6 +123,7 @@ class DamperThermostatColdFanModeSelect(SelectEntity, RestoreEntity):
     def __init__(self, entry_id: str, initial_value: str) -> None:
         """Initialize the select."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{CONF_COLD_FAN_MODE}"
         self._attr_name = "Cold Fan Mode"
         self._attr_current_option = initial_value if initial_value in FAN_MODE_OPTIONS else FanMode.AUTO
@@ -175,13 +169,6 @@ class DamperThermostatColdFanModeSelect(SelectEntity, RestoreEntity):
         """Return the current option."""
         return self._attr_current_option
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
-
     @property
     def icon(self):
         return "mdi:snowflake-thermometer" if self._attr_current_option == FanMode.AUTO else "mdi:snowflake-off"
\ No newline at end of file
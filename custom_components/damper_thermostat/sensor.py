@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, callback, Event, EventStateChangedData
+from homeassistant.core import HassJobType, HomeAssistant, callback, Event, EventStateChangedData
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -66,7 +65,9 @@ class DamperThermostatActuatorSensor(SensorEntity):
     def __init__(self, entry_id: str, actuator_switch_entity_ids: list[str]) -> None:
         """Initialize the actuator status sensor."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._actuator_switch_entity_ids = actuator_switch_entity_ids
+        self._open_switches: set[str] = set()
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_actuator_status"
         self._attr_name = "Actuator Switch"
         self._attr_icon = "mdi:valve"
@@ -85,6 +86,7 @@ class DamperThermostatActuatorSensor(SensorEntity):
                 self.hass,
                 self._actuator_switch_entity_ids,
                 self._async_actuator_switch_changed,
+                job_type=HassJobType.Callback,
             )
         )
 
@@ -95,26 +97,32 @@ class DamperThermostatActuatorSensor(SensorEntity):
         """Handle actuator switch state changes."""
         new_state = event.data["new_state"]
         if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-            return
-
-        self._update_state()
+            # An unavailable or removed switch no longer counts as open
+            self._open_switches.discard(event.data["entity_id"])
+        else:
+            self._set_switch_state(event.data["entity_id"], new_state.state)
+        self._update_native_value()
         self.async_write_ha_state()
 
     def _update_state(self) -> None:
         """Read current actuator switch states and update native_value."""
+        self._open_switches.clear()
         for switch_id in self._actuator_switch_entity_ids:
             state = self.hass.states.get(switch_id)
-            if state is not None and state.state == "on":
-                self._attr_native_value = "Open"
-                return
-        self._attr_native_value = "Close"
+            if state is not None:
+                self._set_switch_state(switch_id, state.state)
+        self._update_native_value()
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
+    def _set_switch_state(self, switch_id: str, state: str) -> None:
+        """Record whether an actuator switch is open."""
+        if state == "on":
+            self._open_switches.add(switch_id)
+        else:
+            self._open_switches.discard(switch_id)
+
+    def _update_native_value(self) -> None:
+        """Update native_value from the open actuator switches."""
+        self._attr_native_value = "Open" if self._open_switches else "Close"
 
 
 class DamperThermostatColdToleranceSensor(SensorEntity):
@@ -126,19 +134,13 @@ class DamperThermostatColdToleranceSensor(SensorEntity):
     def __init__(self, entry_id: str, cold_tolerance: float) -> None:
         """Initialize the cold tolerance sensor."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_cold_tolerance"
         self._attr_name = "Cold Tolerance"
         self._attr_native_value = cold_tolerance
         self._attr_icon = "mdi:thermometer-chevron-down"
         self._attr_state_class = "measurement"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
-
 
 class DamperThermostatHotToleranceSensor(SensorEntity):
     """Diagnostic sensor showing the hot tolerance value."""
@@ -149,15 +151,9 @@ class DamperThermostatHotToleranceSensor(SensorEntity):
     def __init__(self, entry_id: str, hot_tolerance: float) -> None:
         """Initialize the hot tolerance sensor."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_hot_tolerance"
         self._attr_name = "Hot Tolerance"
         self._attr_native_value = hot_tolerance
         self._attr_icon = "mdi:thermometer-chevron-up"
         self._attr_state_class = "measurement"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
\ No newline at end of file
@@ -49,10 +49,12 @@ class DamperThermostatReverseSwitch(SwitchEntity, RestoreEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_has_entity_name = True
+    _attr_icon = "mdi:rotate-right"
 
     def __init__(self, entry_id: str, initial_value: bool) -> None:
         """Initialize the switch."""
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry_id)})
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_reverse_heat_cool_range"
         self._attr_name = "Reverse Heat/Cool Range"
         self._attr_is_on = initial_value
@@ -99,14 +101,3 @@ class DamperThermostatReverseSwitch(SwitchEntity, RestoreEntity):
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
         return self._attr_is_on
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information to link this entity to the thermostat device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-        )
-    
-    @property
-    def icon(self):
-        return "mdi:rotate-right"
\ No newline at end of file